@@ -8,34 +8,64 @@ Gotchas:
   - Use dependency injection for database connections
 """
 
-from typing import List, Optional, Dict, Any
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List,
+    Mapping, Optional, Tuple, TypeVar,
+)
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime
+import asyncio
+import functools
 import logging
 
+import asyncpg
+from asyncpg.exceptions import PostgresConnectionError, UniqueViolationError
+import orjson
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# PATTERN: Only wrap errors the caller can act on (e.g. retry); anything
+# else is a bug and should propagate with its own type and traceback
+_CONNECTION_ERRORS = (PostgresConnectionError, OSError)
+
+# PATTERN: Fixed error messages - the driver error travels as __cause__
+# (raise ... from e), so the error path never formats str(e)
+_MSG_FIND = "Failed to find user"
+_MSG_FIND_MANY = "Failed to find users"
+_MSG_STREAM = "Failed to stream users"
+_MSG_DUPLICATE = "User already exists"
+_MSG_CREATE = "Failed to create user"
+_MSG_CREATE_MANY = "Failed to create users"
+_MSG_UPDATE = "Failed to update user"
+_MSG_DELETE = "Failed to delete user"
+_MSG_FIND_BY_EMAIL = "Failed to find user by email"
+_MSG_EXISTS = "Failed to check user"
+_MSG_ID_BY_EMAIL = "Failed to find user id by email"
+
 # Base Repository Interface
 class IRepository(ABC):
     """Base repository interface defining standard CRUD operations"""
     
     @abstractmethod
-    async def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+    async def find_by_id(self, id: str) -> Optional[Mapping[str, Any]]:
         """Find a single entity by ID"""
         pass
     
     @abstractmethod
-    async def find_all(self, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    async def find_all(self, filters: Optional[Dict] = None) -> List[Mapping[str, Any]]:
         """Find all entities matching filters"""
         pass
     
     @abstractmethod
-    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create(self, data: Dict[str, Any]) -> Mapping[str, Any]:
         """Create a new entity"""
         pass
     
     @abstractmethod
-    async def update(self, id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def update(self, id: str, data: Dict[str, Any]) -> Optional[Mapping[str, Any]]:
         """Update an existing entity"""
         pass
     
@@ -49,135 +79,471 @@ class IRepository(ABC):
 class UserRepository(IRepository):
     """Repository for User entities"""
     
-    def __init__(self, db_connection):
+    table_name = "users"
+    
+    # PATTERN: Fixed SQL is built once at class load, so the query text is
+    # identical on every call and hits asyncpg's per-connection statement cache
+    _SQL_FIND_BY_ID = f"SELECT * FROM {table_name} WHERE id = $1"
+    _SQL_FIND_BY_EMAIL = (
+        f"SELECT * FROM {table_name} WHERE email = $1 AND deleted_at IS NULL"
+    )
+    _SQL_FIND_BY_IDS = (
+        f"SELECT * FROM {table_name} WHERE id = ANY($1) AND deleted_at IS NULL"
+    )
+    _SQL_EXISTS_BY_ID = (
+        f"SELECT 1 FROM {table_name} WHERE id = $1 AND deleted_at IS NULL"
+    )
+    _SQL_ID_BY_EMAIL = (
+        f"SELECT id FROM {table_name} WHERE email = $1 AND deleted_at IS NULL"
+    )
+    _SQL_FIND_ALL_BASE = f"SELECT * FROM {table_name}"
+    _SQL_FIND_ALL = f"{_SQL_FIND_ALL_BASE} LIMIT 1000"
+    _SQL_DELETE = f"""
+        UPDATE {table_name}
+        SET deleted_at = $1, updated_at = $1
+        WHERE id = $2 AND deleted_at IS NULL
+    """
+    
+    # PATTERN: Bound in-process caches so hot keys can't grow memory forever
+    _CACHE_MAX = 4096
+    # Compiled SQL is keyed on caller-supplied shapes, so bound it too
+    _SQL_CACHE_MAX = 256
+    # PATTERN: Above this many rows, COPY beats executemany
+    _COPY_THRESHOLD = 1000
+    
+    def __init__(self, db_pool: asyncpg.Pool):
+        """
+        Initialize repository with a connection pool
+        
+        PATTERN: Dependency injection - pass the pool, don't create it
+        PATTERN: Use pool.fetchrow/fetch/execute so each query holds a
+                 connection only for its own duration
+        """
+        self.pool = db_pool
+        # PATTERN: Read-through LRU caches, invalidated on every write.
+        # No lock needed - the event loop runs these methods on one thread.
+        self._by_id_cache: "OrderedDict[str, asyncpg.Record]" = OrderedDict()
+        self._by_email_cache: "OrderedDict[str, str]" = OrderedDict()  # email -> id
+        # PATTERN: Bumped by every write; a read only fills the cache if no
+        # write happened while it was waiting on the database
+        self._write_gen = 0
+        # PATTERN: Single-flight - one query per id, however many callers wait
+        self._inflight: Dict[str, "asyncio.Task[Optional[asyncpg.Record]]"] = {}
+        # PATTERN: Compile each filter shape once
+        # (filter keys, suffix, has cursor, paged) -> (SQL, sorted keys)
+        self._filter_sql_cache: OrderedDict = OrderedDict()
+        # PATTERN: Compile each INSERT/UPDATE column set once
+        # (kind, columns, returning) -> SQL
+        self._write_sql_cache: OrderedDict = OrderedDict()
+    
+    def _cache_get(self, id: str) -> Optional[asyncpg.Record]:
+        """Return the cached row for id and mark it most recently used"""
+        row = self._by_id_cache.get(id)
+        if row is not None:
+            self._by_id_cache.move_to_end(id)
+        return row
+    
+    def _cache_put(self, id: str, row: asyncpg.Record) -> bool:
+        """
+        Cache row under id, evicting the least recently used entry
+        
+        Returns False, caching nothing, if the row holds decoded json/jsonb.
+        
+        PATTERN: Only cache rows that are immutable all the way down - a
+                 Record is, but the dicts/lists our json codecs decode are
+                 not, and one caller's edit would leak into every later hit
+        """
+        if any(isinstance(value, (dict, list)) for value in row.values()):
+            return False
+        
+        self._by_id_cache[id] = row
+        self._by_id_cache.move_to_end(id)
+        if len(self._by_id_cache) > self._CACHE_MAX:
+            self._by_id_cache.popitem(last=False)
+        return True
+    
+    def _cache_invalidate(self, id: str) -> None:
         """
-        Initialize repository with database connection
+        Drop the cached row for id
         
-        PATTERN: Dependency injection - pass connection, don't create it
+        PATTERN: The email cache only points at ids, so dropping the row is
+                 enough to invalidate every email that resolved to it
+        PATTERN: Forget any in-flight read too, so a row fetched before the
+                 write is never cached after it
         """
-        self.db = db_connection
-        self.table_name = "users"
+        self._by_id_cache.pop(id, None)
+        self._inflight.pop(id, None)
+        self._write_gen += 1
     
-    async def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+    def _email_cache_get(self, email: str) -> Optional[asyncpg.Record]:
+        """Return the cached live row for email, if it still matches"""
+        user_id = self._by_email_cache.get(email)
+        if user_id is None:
+            return None
+        
+        cached = self._cache_get(user_id)
+        # A changed email or a soft delete turns the entry into a miss
+        if (
+            cached is not None
+            and cached['email'] == email
+            and cached['deleted_at'] is None
+        ):
+            self._by_email_cache.move_to_end(email)
+            return cached
+        return None
+    
+    def _email_cache_put(self, email: str, row: asyncpg.Record) -> None:
+        """Cache row and index it by email"""
+        # str(): uuid columns decode to UUID, callers pass str ids
+        user_id = str(row['id'])
+        if not self._cache_put(user_id, row):
+            return
+        self._by_email_cache[email] = user_id
+        self._by_email_cache.move_to_end(email)
+        if len(self._by_email_cache) > self._CACHE_MAX:
+            self._by_email_cache.popitem(last=False)
+    
+    @staticmethod
+    def _sql_cache_get(cache: OrderedDict, key: Any) -> Any:
+        """Return the compiled SQL for key and mark it most recently used"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    def _sql_cache_put(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """Store compiled SQL, evicting the least recently used shape"""
+        cache[key] = value
+        if len(cache) > self._SQL_CACHE_MAX:
+            cache.popitem(last=False)
+    
+    def _filtered_select(
+        self,
+        filters: Dict,
+        suffix: str = "",
+        after: Optional[Tuple[datetime, str]] = None,
+        page_size: Optional[int] = None,
+    ) -> Tuple[str, List[Any]]:
+        """
+        Return the SELECT for this filter shape plus its parameters
+        
+        With page_size the rows are keyset-paged by (created_at, id), starting
+        after the `after` cursor; both go after the filter parameters.
+        
+        PATTERN: Safe query building - sorted keys give one SQL string per
+                 filter shape regardless of dict order
+        """
+        shape = (frozenset(filters), suffix, after is not None, page_size is not None)
+        cached = self._sql_cache_get(self._filter_sql_cache, shape)
+        if cached is None:
+            keys = sorted(shape[0])
+            conditions = [f"{key} = ${i}" for i, key in enumerate(keys, 1)]
+            n = len(keys)
+            if after is not None:
+                conditions.append(f"(created_at, id) > (${n + 1}, ${n + 2})")
+                n += 2
+            
+            query = self._SQL_FIND_ALL_BASE
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            if page_size is not None:
+                query += f" ORDER BY created_at, id LIMIT ${n + 1}"
+            cached = (query + suffix, keys)
+            self._sql_cache_put(self._filter_sql_cache, shape, cached)
+        
+        query, keys = cached
+        params = [filters[key] for key in keys]
+        if after is not None:
+            params.extend(after)
+        if page_size is not None:
+            params.append(page_size)
+        return query, params
+    
+    def _insert_sql(self, columns: Tuple[str, ...], returning: Optional[str] = None) -> str:
+        """
+        Return the INSERT for columns, building it on first use
+        
+        PATTERN: Only ask for the columns the caller needs back
+        PATTERN: Same-shaped writes reuse one SQL string, so the hot path
+                 just passes data.values() through
+        """
+        key = ("insert", columns, returning)
+        query = self._sql_cache_get(self._write_sql_cache, key)
+        if query is None:
+            placeholders = [f"${i}" for i in range(1, len(columns) + 1)]
+            query = f"""
+                INSERT INTO {self.table_name}
+                ({', '.join(columns)})
+                VALUES ({', '.join(placeholders)})
+            """
+            if returning:
+                query += f"RETURNING {returning}"
+            self._sql_cache_put(self._write_sql_cache, key, query)
+        return query
+    
+    def _update_sql(self, columns: Tuple[str, ...], returning: Optional[str] = None) -> str:
+        """Return the UPDATE of columns by id; id is the last parameter"""
+        key = ("update", columns, returning)
+        query = self._sql_cache_get(self._write_sql_cache, key)
+        if query is None:
+            set_clauses = [f"{col} = ${i}" for i, col in enumerate(columns, 1)]
+            query = f"""
+                UPDATE {self.table_name}
+                SET {', '.join(set_clauses)}
+                WHERE id = ${len(columns) + 1}
+            """
+            if returning:
+                query += f"RETURNING {returning}"
+            self._sql_cache_put(self._write_sql_cache, key, query)
+        return query
+    
+    async def find_by_id(self, id: str) -> Optional[asyncpg.Record]:
         """
         Find user by ID
         
         PATTERN: Always handle not found gracefully
+        PATTERN: Serve hot keys from cache - only rows without json/jsonb
+                 values are cached (see _cache_put)
+        Gotcha: Concurrent callers coalesced onto one query get the same
+                Record; never mutate nested json/jsonb values in place
         """
+        cached = self._cache_get(id)
+        if cached is not None:
+            return cached
+        
+        # PATTERN: Coalesce concurrent misses for the same id into one query
+        task = self._inflight.get(id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_by_id(id))
+            self._inflight[id] = task
+            task.add_done_callback(functools.partial(self._on_fetched, id))
+        
+        # shield: a cancelled caller must not cancel the query others await
+        return await asyncio.shield(task)
+    
+    async def _fetch_by_id(self, id: str) -> Optional[asyncpg.Record]:
+        """Query a single user by ID, bypassing the cache"""
         try:
-            query = f"SELECT * FROM {self.table_name} WHERE id = ?"
-            result = await self.db.fetch_one(query, [id])
-            
-            if result:
-                logger.info(f"Found user with id: {id}")
-                return dict(result)
-            
-            logger.info(f"User not found with id: {id}")
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error finding user by id {id}: {str(e)}")
-            raise RepositoryError(f"Failed to find user: {str(e)}")
+            result = await self.pool.fetchrow(self._SQL_FIND_BY_ID, id)
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error finding user by id %s: %s", id, e)
+            raise RepositoryError(_MSG_FIND) from e
+        
+        if result:
+            logger.info("Found user with id: %s", id)
+            return result
+        
+        logger.info("User not found with id: %s", id)
+        return None
+    
+    def _on_fetched(self, id: str, task: "asyncio.Task[Optional[asyncpg.Record]]") -> None:
+        """Retire a finished single-flight query and cache its row"""
+        if self._inflight.get(id) is not task:
+            # Invalidated by a write while in flight - don't cache stale data
+            return
+        del self._inflight[id]
+        
+        if not task.cancelled() and task.exception() is None:
+            result = task.result()
+            if result is not None:
+                self._cache_put(id, result)
     
-    async def find_all(self, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    async def find_all(self, filters: Optional[Dict] = None) -> List[asyncpg.Record]:
         """
         Find all users matching filters
         
         PATTERN: Build dynamic queries safely
+        PATTERN: Return driver Records as-is - no per-row dict copies
+        Gotcha: Deprecated for large tables - results are silently capped at
+                1000 rows; use find_all_paginated or iter_all instead
         """
-        try:
-            query = f"SELECT * FROM {self.table_name}"
-            params = []
-            
-            if filters:
-                # PATTERN: Safe query building
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(f"{key} = ?")
-                    params.append(value)
-                
-                if conditions:
-                    query += " WHERE " + " AND ".join(conditions)
-            
+        if filters:
             # PATTERN: Always limit results to prevent memory issues
-            query += " LIMIT 1000"
-            
-            results = await self.db.fetch_all(query, params)
-            return [dict(row) for row in results]
-            
-        except Exception as e:
-            logger.error(f"Error finding users: {str(e)}")
-            raise RepositoryError(f"Failed to find users: {str(e)}")
+            query, params = self._filtered_select(filters, " LIMIT 1000")
+        else:
+            query, params = self._SQL_FIND_ALL, []
+        
+        try:
+            return await self.pool.fetch(query, *params)
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error finding users: %s", e)
+            raise RepositoryError(_MSG_FIND_MANY) from e
+    
+    async def find_all_paginated(
+        self,
+        filters: Optional[Dict] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: int = 1000,
+    ) -> Tuple[List[asyncpg.Record], Optional[Tuple[datetime, str]]]:
+        """
+        Find one page of users matching filters, ordered by (created_at, id)
+        
+        Returns the page and the cursor to pass as `after` for the next one,
+        or None once the last page has been read.
+        
+        PATTERN: Keyset pagination - each page costs O(limit) no matter how
+                 deep it is, unlike OFFSET
+        Gotcha: Needs an index on (created_at, id) to stay fast
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        
+        query, params = self._filtered_select(
+            filters or {}, after=after, page_size=limit
+        )
+        
+        try:
+            rows = await self.pool.fetch(query, *params)
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error finding users page: %s", e)
+            raise RepositoryError(_MSG_FIND_MANY) from e
+        
+        # A short page means there is nothing after it
+        if len(rows) < limit:
+            return rows, None
+        return rows, (rows[-1]['created_at'], rows[-1]['id'])
+    
+    async def iter_all(
+        self, filters: Optional[Dict] = None, prefetch: int = 100
+    ) -> AsyncIterator[asyncpg.Record]:
+        """
+        Stream all users matching filters
+        
+        PATTERN: Server-side cursor - only `prefetch` rows are held in
+                 memory at a time, however large the result set
+        Gotcha: Holds one pool connection until iteration finishes
+        """
+        if filters:
+            query, params = self._filtered_select(filters)
+        else:
+            query, params = self._SQL_FIND_ALL_BASE, []
+        
+        try:
+            async with self.pool.acquire() as conn:
+                # PATTERN: asyncpg cursors must run inside a transaction
+                async with conn.transaction():
+                    async for record in conn.cursor(query, *params, prefetch=prefetch):
+                        yield record
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error streaming users: %s", e)
+            raise RepositoryError(_MSG_STREAM) from e
     
-    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create(self, data: Dict[str, Any]) -> asyncpg.Record:
         """
         Create new user
         
         PATTERN: Always validate and sanitize input
+        PATTERN: Surface constraint violations as distinct error types
         """
+        # PATTERN: Add metadata - one timestamp per operation
+        now = datetime.utcnow()
+        data['created_at'] = now
+        data['updated_at'] = now
+        
+        # PATTERN: Build insert query dynamically
+        query = self._insert_sql(tuple(data), "*")
+        
         try:
-            # PATTERN: Add metadata
-            data['created_at'] = datetime.utcnow()
-            data['updated_at'] = datetime.utcnow()
-            
-            # PATTERN: Build insert query dynamically
-            columns = list(data.keys())
-            placeholders = ["?" for _ in columns]
-            values = list(data.values())
-            
-            query = f"""
-                INSERT INTO {self.table_name} 
-                ({', '.join(columns)}) 
-                VALUES ({', '.join(placeholders)})
-                RETURNING *
-            """
-            
-            result = await self.db.fetch_one(query, values)
-            logger.info(f"Created user with id: {result['id']}")
-            
-            return dict(result)
-            
-        except Exception as e:
-            logger.error(f"Error creating user: {str(e)}")
-            raise RepositoryError(f"Failed to create user: {str(e)}")
+            result = await self.pool.fetchrow(query, *data.values())
+        except UniqueViolationError as e:
+            raise DuplicateUserError(_MSG_DUPLICATE) from e
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error creating user: %s", e)
+            raise RepositoryError(_MSG_CREATE) from e
+        
+        logger.info("Created user with id: %s", result['id'])
+        return result
     
-    async def update(self, id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def create_returning_id(self, data: Dict[str, Any]) -> str:
+        """
+        Create new user and return only its ID
+        
+        PATTERN: Skip decoding the full row when the caller only needs the ID
+        """
+        # PATTERN: Add metadata - one timestamp per operation
+        now = datetime.utcnow()
+        data['created_at'] = now
+        data['updated_at'] = now
+        
+        query = self._insert_sql(tuple(data), "id")
+        
+        try:
+            user_id = await self.pool.fetchval(query, *data.values())
+        except UniqueViolationError as e:
+            raise DuplicateUserError(_MSG_DUPLICATE) from e
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error creating user: %s", e)
+            raise RepositoryError(_MSG_CREATE) from e
+        
+        logger.info("Created user with id: %s", user_id)
+        # str(): uuid columns decode to UUID, the rest of the API uses str ids
+        return str(user_id)
+    
+    async def update(self, id: str, data: Dict[str, Any]) -> Optional[asyncpg.Record]:
         """
         Update existing user
         
         PATTERN: Partial updates - only update provided fields
         """
+        # PATTERN: Don't allow ID updates
+        data.pop('id', None)
+        
+        # PATTERN: Track update time
+        data['updated_at'] = datetime.utcnow()
+        
+        # Build update query
+        query = self._update_sql(tuple(data), "*")
+        
         try:
-            # PATTERN: Don't allow ID updates
-            data.pop('id', None)
-            
-            # PATTERN: Track update time
-            data['updated_at'] = datetime.utcnow()
-            
-            # Build update query
-            set_clauses = [f"{key} = ?" for key in data.keys()]
-            values = list(data.values())
-            values.append(id)  # For WHERE clause
-            
-            query = f"""
-                UPDATE {self.table_name}
-                SET {', '.join(set_clauses)}
-                WHERE id = ?
-                RETURNING *
-            """
-            
-            result = await self.db.fetch_one(query, values)
-            
-            if result:
-                logger.info(f"Updated user with id: {id}")
-                return dict(result)
-            
-            logger.info(f"User not found for update with id: {id}")
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error updating user {id}: {str(e)}")
-            raise RepositoryError(f"Failed to update user: {str(e)}")
+            result = await self.pool.fetchrow(query, *data.values(), id)
+        except UniqueViolationError as e:
+            raise DuplicateUserError(_MSG_DUPLICATE) from e
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error updating user %s: %s", id, e)
+            raise RepositoryError(_MSG_UPDATE) from e
+        
+        # Drop any in-flight read first so it can't overwrite the fresh row
+        self._cache_invalidate(id)
+        
+        if result:
+            logger.info("Updated user with id: %s", id)
+            self._cache_put(id, result)
+            return result
+        
+        logger.info("User not found for update with id: %s", id)
+        return None
+    
+    async def update_fields(self, id: str, data: Dict[str, Any]) -> bool:
+        """
+        Update existing user without returning the row
+        
+        PATTERN: No RETURNING clause when the caller doesn't need the row
+        """
+        # PATTERN: Don't allow ID updates
+        data.pop('id', None)
+        
+        # PATTERN: Track update time
+        data['updated_at'] = datetime.utcnow()
+        
+        query = self._update_sql(tuple(data))
+        
+        try:
+            status = await self.pool.execute(query, *data.values(), id)
+        except UniqueViolationError as e:
+            raise DuplicateUserError(_MSG_DUPLICATE) from e
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error updating user %s: %s", id, e)
+            raise RepositoryError(_MSG_UPDATE) from e
+        
+        # The new row wasn't fetched, so the cached one can't be refreshed
+        self._cache_invalidate(id)
+        
+        if int(status.split()[-1]) > 0:
+            logger.info("Updated user with id: %s", id)
+            return True
+        
+        logger.info("User not found for update with id: %s", id)
+        return False
     
     async def delete(self, id: str) -> bool:
         """
@@ -185,49 +551,179 @@ class UserRepository(IRepository):
         
         PATTERN: Prefer soft deletes for audit trail
         """
+        # PATTERN: Soft delete by default
+        now = datetime.utcnow()
         try:
-            # PATTERN: Soft delete by default
-            query = f"""
-                UPDATE {self.table_name}
-                SET deleted_at = ?, updated_at = ?
-                WHERE id = ? AND deleted_at IS NULL
-            """
-            
-            now = datetime.utcnow()
-            result = await self.db.execute(query, [now, now, id])
-            
-            if result.rowcount > 0:
-                logger.info(f"Soft deleted user with id: {id}")
-                return True
-            
-            logger.info(f"User not found for deletion with id: {id}")
-            return False
-            
-        except Exception as e:
-            logger.error(f"Error deleting user {id}: {str(e)}")
-            raise RepositoryError(f"Failed to delete user: {str(e)}")
+            status = await self.pool.execute(self._SQL_DELETE, now, id)
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error deleting user %s: %s", id, e)
+            raise RepositoryError(_MSG_DELETE) from e
+        
+        self._cache_invalidate(id)
+        
+        # PATTERN: asyncpg returns the command tag, e.g. "UPDATE 1"
+        if int(status.split()[-1]) > 0:
+            logger.info("Soft deleted user with id: %s", id)
+            return True
+        
+        logger.info("User not found for deletion with id: %s", id)
+        return False
     
     # Additional specialized methods
-    async def find_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+    async def find_by_email(self, email: str) -> Optional[asyncpg.Record]:
         """
         Find user by email
         
         PATTERN: Add specialized queries as needed
         """
+        cached = self._email_cache_get(email)
+        if cached is not None:
+            return cached
+        
+        write_gen = self._write_gen
         try:
-            query = f"""
-                SELECT * FROM {self.table_name} 
-                WHERE email = ? AND deleted_at IS NULL
-            """
-            result = await self.db.fetch_one(query, [email])
-            
-            if result:
-                return dict(result)
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error finding user by email {email}: {str(e)}")
-            raise RepositoryError(f"Failed to find user by email: {str(e)}")
+            result = await self.pool.fetchrow(self._SQL_FIND_BY_EMAIL, email)
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error finding user by email %s: %s", email, e)
+            raise RepositoryError(_MSG_FIND_BY_EMAIL) from e
+        
+        if result:
+            # The id isn't known until the row arrives, so any write during
+            # the query makes the row suspect - return it, don't cache it
+            if write_gen == self._write_gen:
+                self._email_cache_put(email, result)
+            return result
+        return None
+    
+    async def find_by_ids(self, ids: Iterable[str]) -> Dict[str, asyncpg.Record]:
+        """
+        Find live users by ID, keyed by str(ID); missing IDs are simply absent
+        
+        PATTERN: One query for N lookups instead of N round-trips
+        """
+        found: Dict[str, asyncpg.Record] = {}
+        missing = []
+        for id in dict.fromkeys(ids):
+            cached = self._cache_get(id)
+            if cached is None:
+                missing.append(id)
+            elif cached['deleted_at'] is None:
+                found[id] = cached
+        
+        if not missing:
+            return found
+        
+        write_gen = self._write_gen
+        try:
+            # PATTERN: Let Postgres infer the array type from the id column
+            results = await self.pool.fetch(self._SQL_FIND_BY_IDS, missing)
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error finding users by ids: %s", e)
+            raise RepositoryError(_MSG_FIND_MANY) from e
+        
+        # Rows fetched across a write may be stale - return, don't cache
+        cacheable = write_gen == self._write_gen
+        for row in results:
+            # str(): uuid columns decode to UUID, callers pass str ids
+            user_id = str(row['id'])
+            if cacheable:
+                self._cache_put(user_id, row)
+            found[user_id] = row
+        return found
+    
+    async def exists_by_id(self, id: str) -> bool:
+        """
+        Check whether a live (not soft-deleted) user exists
+        
+        PATTERN: Use fetchval for presence checks - no row to decode
+        """
+        cached = self._cache_get(id)
+        if cached is not None:
+            return cached['deleted_at'] is None
+        
+        try:
+            return await self.pool.fetchval(self._SQL_EXISTS_BY_ID, id) is not None
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error checking user %s: %s", id, e)
+            raise RepositoryError(_MSG_EXISTS) from e
+    
+    async def get_id_by_email(self, email: str) -> Optional[str]:
+        """
+        Resolve a live user's ID from their email
+        
+        PATTERN: Select only the column you need
+        """
+        # str(): uuid columns decode to UUID, the rest of the API uses str ids
+        cached = self._email_cache_get(email)
+        if cached is not None:
+            return str(cached['id'])
+        
+        try:
+            user_id = await self.pool.fetchval(self._SQL_ID_BY_EMAIL, email)
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error finding user id by email %s: %s", email, e)
+            raise RepositoryError(_MSG_ID_BY_EMAIL) from e
+        
+        return None if user_id is None else str(user_id)
+    
+    async def pipeline(self, ops: Iterable[Callable[[], Awaitable[T]]]) -> List[T]:
+        """
+        Run independent repository calls concurrently, results in order
+        
+        PATTERN: Overlap round-trips - latency is the slowest call, not the sum
+        Gotcha: asyncpg runs one query at a time per connection, so each call
+                uses its own pooled connection; calls must not depend on each
+                other or need a shared transaction
+        """
+        return list(await asyncio.gather(*(op() for op in ops)))
+    
+    async def find_by_id_and_email(
+        self, id: str, email: str
+    ) -> Tuple[Optional[asyncpg.Record], Optional[asyncpg.Record]]:
+        """
+        Look up a user by ID and a user by email in one round-trip time
+        
+        PATTERN: Use pipeline for unrelated reads a request needs together
+        """
+        by_id, by_email = await self.pipeline([
+            lambda: self.find_by_id(id),
+            lambda: self.find_by_email(email),
+        ])
+        return by_id, by_email
+    
+    async def create_many(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Create users in bulk, returning the number of rows inserted
+        
+        PATTERN: One round-trip per batch instead of one per row
+        PATTERN: Rows must share the columns of the first row
+        """
+        if not rows:
+            return 0
+        
+        # PATTERN: Add metadata - one timestamp for the whole batch
+        now = datetime.utcnow()
+        columns = tuple(c for c in rows[0] if c not in ('created_at', 'updated_at'))
+        records = [tuple(row[c] for c in columns) + (now, now) for row in rows]
+        columns += ('created_at', 'updated_at')
+        
+        try:
+            if len(records) > self._COPY_THRESHOLD:
+                # PATTERN: COPY protocol for large batches
+                async with self.pool.acquire() as conn:
+                    await conn.copy_records_to_table(
+                        self.table_name, records=records, columns=columns
+                    )
+            else:
+                await self.pool.executemany(self._insert_sql(columns), records)
+        except UniqueViolationError as e:
+            raise DuplicateUserError(_MSG_DUPLICATE) from e
+        except _CONNECTION_ERRORS as e:
+            logger.error("Error creating users in bulk: %s", e)
+            raise RepositoryError(_MSG_CREATE_MANY) from e
+        
+        logger.info("Created %s users", len(records))
+        return len(records)
 
 
 # Custom Exception
@@ -236,6 +732,73 @@ class RepositoryError(Exception):
     pass
 
 
+class DuplicateUserError(RepositoryError):
+    """Raised when a write violates a unique constraint (e.g. email)"""
+    pass
+
+
+# Serialization Helper
+def records_to_json(records: Iterable[asyncpg.Record]) -> bytes:
+    """
+    Serialize rows to JSON for API responses
+    
+    PATTERN: Materialize dicts only at the edge, in one orjson call
+    NOTE: default=str covers types orjson doesn't know, such as asyncpg's
+          own UUID (uuid columns) and Decimal (numeric columns)
+    """
+    return orjson.dumps([dict(record) for record in records], default=str)
+
+
+# Pool Factory
+def _jsonb_encode(value: Any) -> bytes:
+    """Encode jsonb in binary format: a version byte, then the JSON text"""
+    return b"\x01" + orjson.dumps(value)
+
+
+def _jsonb_decode(data: bytes) -> Any:
+    """Decode binary jsonb, skipping the version byte"""
+    return orjson.loads(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Register type codecs on every new pool connection
+    
+    PATTERN: Decode json/jsonb once in the driver instead of in every caller
+    PATTERN: Binary format + orjson - no str round-trip, C-speed parsing
+    NOTE: uuid already uses asyncpg's native binary codec - don't override it
+    """
+    await conn.set_type_codec(
+        "json",
+        encoder=orjson.dumps,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="binary",
+    )
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_jsonb_encode,
+        decoder=_jsonb_decode,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
+async def create_pool(dsn: str) -> asyncpg.Pool:
+    """
+    Create the shared connection pool
+    
+    PATTERN: One pool per process, created at startup and injected
+    """
+    return await asyncpg.create_pool(
+        dsn,
+        min_size=10,
+        max_size=50,
+        max_inactive_connection_lifetime=300,
+        init=_init_connection,
+    )
+
+
 # Usage Example
 """
 # In your service layer:
@@ -249,13 +812,34 @@ class UserService:
             raise NotFoundError(f"User {user_id} not found")
         return user
     
+    async def get_users(self, user_ids: list):
+        # One query instead of awaiting find_by_id in a loop
+        return await self.repo.find_by_ids(user_ids)
+    
+    async def get_user_with_team(self, user_id: str, team_id: str):
+        # Independent reads overlap instead of running back to back
+        user, teammates = await self.repo.pipeline([
+            lambda: self.repo.find_by_id(user_id),
+            lambda: self.repo.find_all({"team_id": team_id}),
+        ])
+        return user, teammates
+    
+    async def ensure_user_exists(self, user_id: str):
+        # Presence checks don't need the row
+        if not await self.repo.exists_by_id(user_id):
+            raise NotFoundError(f"User {user_id} not found")
+    
     async def create_user(self, user_data: dict):
         # Business logic here (validation, etc.)
-        return await self.repo.create(user_data)
+        try:
+            return await self.repo.create(user_data)
+        except DuplicateUserError:
+            # Not transient - report it, don't retry
+            raise ConflictError("Email already registered")
 
 # In your DI container or main:
-db_connection = get_database_connection()
-user_repo = UserRepository(db_connection)
+db_pool = await create_pool(settings.DATABASE_URL)
+user_repo = UserRepository(db_pool)
 user_service = UserService(user_repo)
 """
 
@@ -266,6 +850,14 @@ class BadRepository:
         # ANTI-PATTERN: Creating connection inside repository
         self.db = create_connection()  # Don't do this!
     
+    async def find_by_id(self, id):
+        # ANTI-PATTERN: Acquiring a connection around every single query
+        async with self.pool.acquire() as conn:  # Use pool.fetchrow instead!
+            row = await conn.fetchrow("SELECT * FROM users WHERE id = $1", id)
+        # ANTI-PATTERN: f-string is formatted even when INFO is disabled
+        logger.info(f"Found user with id: {id}")  # Pass id as an argument!
+        return row
+    
     def find_user(self, id):
         # ANTI-PATTERN: Synchronous database calls
         return self.db.query(f"SELECT * FROM users WHERE id = {id}")  # SQL injection!